@@ -0,0 +1,354 @@
+use std::{cmp::Ordering, collections::HashMap, fmt};
+
+use rustc_hash::FxHashMap;
+
+use crate::model::{
+    coefficient::Coefficient, constraint::Constraint, lp_problem::LPProblem, objective::Objective, operator::ComparisonOp, sense::Sense,
+    variable::VariableType,
+};
+
+#[derive(Debug, PartialEq, Clone)]
+#[cfg_attr(feature = "serde", derive(serde::Serialize))]
+/// A change observed when moving from one LP problem to another
+pub enum Change<T> {
+    /// Only present in the second problem
+    Added(T),
+    /// Only present in the first problem
+    Removed(T),
+    /// Present in both problems, with differing values
+    Modified { from: T, to: T },
+}
+
+#[derive(Debug, PartialEq, Clone)]
+#[cfg_attr(feature = "serde", derive(serde::Serialize))]
+pub struct CoefficientDiff<'a> {
+    pub var_name: &'a str,
+    pub change: Change<f64>,
+}
+
+#[derive(Debug, PartialEq, Clone)]
+#[cfg_attr(feature = "serde", derive(serde::Serialize))]
+pub struct VariableDiff<'a> {
+    pub name: &'a str,
+    pub change: Change<&'a VariableType>,
+}
+
+#[derive(Debug, PartialEq, Clone)]
+#[cfg_attr(feature = "serde", derive(serde::Serialize))]
+pub enum ObjectiveDiff<'a> {
+    Added(&'a Objective),
+    Removed(&'a Objective),
+    Modified { name: &'a str, coefficients: Vec<CoefficientDiff<'a>> },
+}
+
+#[derive(Debug, PartialEq, Clone)]
+#[cfg_attr(feature = "serde", derive(serde::Serialize))]
+pub enum ConstraintDiff<'a> {
+    Added(&'a Constraint),
+    Removed(&'a Constraint),
+    /// Both constraints share a name and kind; `sense` and `rhs` are only populated for Standard constraints
+    Modified {
+        name: &'a str,
+        #[cfg_attr(feature = "serde", serde(skip_serializing_if = "Option::is_none"))]
+        sense: Option<Change<ComparisonOp>>,
+        #[cfg_attr(feature = "serde", serde(skip_serializing_if = "Option::is_none"))]
+        rhs: Option<Change<f64>>,
+        #[cfg_attr(feature = "serde", serde(skip_serializing_if = "Vec::is_empty"))]
+        coefficients: Vec<CoefficientDiff<'a>>,
+    },
+}
+
+#[derive(Debug, Default, PartialEq, Clone)]
+#[cfg_attr(feature = "serde", derive(serde::Serialize))]
+/// The differences between two LP problems, with each section ordered by name
+///
+/// Names and values are borrowed from the compared problems rather than copied.
+/// Unchanged sections are omitted when serialized, so the output scales with the number of changes.
+pub struct LPDiff<'a> {
+    #[cfg_attr(feature = "serde", serde(skip_serializing_if = "Option::is_none"))]
+    pub problem_name: Option<Change<&'a str>>,
+    #[cfg_attr(feature = "serde", serde(skip_serializing_if = "Option::is_none"))]
+    pub problem_sense: Option<Change<&'a Sense>>,
+    #[cfg_attr(feature = "serde", serde(skip_serializing_if = "Vec::is_empty"))]
+    pub variables: Vec<VariableDiff<'a>>,
+    #[cfg_attr(feature = "serde", serde(skip_serializing_if = "Vec::is_empty"))]
+    pub objectives: Vec<ObjectiveDiff<'a>>,
+    #[cfg_attr(feature = "serde", serde(skip_serializing_if = "Vec::is_empty"))]
+    pub constraints: Vec<ConstraintDiff<'a>>,
+    /// Set by [`LPProblem::diff_summary`], which leaves the objective and constraint sections unchecked
+    #[cfg_attr(feature = "serde", serde(skip_serializing_if = "std::ops::Not::not"))]
+    pub is_summary: bool,
+}
+
+impl<'a> ObjectiveDiff<'a> {
+    #[must_use]
+    pub fn name(&self) -> &'a str {
+        match self {
+            Self::Added(Objective { name, .. }) | Self::Removed(Objective { name, .. }) => name,
+            Self::Modified { name, .. } => name,
+        }
+    }
+}
+
+impl<'a> ConstraintDiff<'a> {
+    #[must_use]
+    pub fn name(&self) -> &'a str {
+        match self {
+            Self::Added(constraint) | Self::Removed(constraint) => constraint.name(),
+            Self::Modified { name, .. } => name,
+        }
+    }
+}
+
+impl LPDiff<'_> {
+    #[must_use]
+    /// Returns `true` if both problems were identical
+    ///
+    /// Always `false` for a summary, since its objectives and constraints were not compared.
+    pub fn is_empty(&self) -> bool {
+        !self.is_summary
+            && self.problem_name.is_none()
+            && self.problem_sense.is_none()
+            && self.variables.is_empty()
+            && self.objectives.is_empty()
+            && self.constraints.is_empty()
+    }
+}
+
+/// Writes a human readable report directly into the formatter, so a whole diff can be emitted
+/// through a single locked or buffered writer
+impl fmt::Display for LPDiff<'_> {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        if let Some(change) = &self.problem_name {
+            write_change(f, 0, "Problem name", change)?;
+        }
+        if let Some(change) = &self.problem_sense {
+            write_change(f, 0, "Problem sense", change)?;
+        }
+        if !self.variables.is_empty() {
+            writeln!(f, "Variables:")?;
+            for VariableDiff { name, change } in &self.variables {
+                write_change(f, 2, name, change)?;
+            }
+        }
+        if !self.objectives.is_empty() {
+            writeln!(f, "Objectives:")?;
+            for objective in &self.objectives {
+                match objective {
+                    ObjectiveDiff::Added(Objective { name, .. }) => writeln!(f, "  + {name}")?,
+                    ObjectiveDiff::Removed(Objective { name, .. }) => writeln!(f, "  - {name}")?,
+                    ObjectiveDiff::Modified { name, coefficients } => {
+                        writeln!(f, "  ~ {name}")?;
+                        write_coefficients(f, coefficients)?;
+                    }
+                }
+            }
+        }
+        if !self.constraints.is_empty() {
+            writeln!(f, "Constraints:")?;
+            for constraint in &self.constraints {
+                match constraint {
+                    ConstraintDiff::Added(c) => writeln!(f, "  + {}", c.name())?,
+                    ConstraintDiff::Removed(c) => writeln!(f, "  - {}", c.name())?,
+                    ConstraintDiff::Modified { name, sense, rhs, coefficients } => {
+                        writeln!(f, "  ~ {name}")?;
+                        if let Some(change) = sense {
+                            write_display_change(f, 4, "sense", change)?;
+                        }
+                        if let Some(change) = rhs {
+                            write_change(f, 4, "rhs", change)?;
+                        }
+                        write_coefficients(f, coefficients)?;
+                    }
+                }
+            }
+        }
+        Ok(())
+    }
+}
+
+fn write_change<T: fmt::Debug>(f: &mut fmt::Formatter<'_>, indent: usize, name: &str, change: &Change<T>) -> fmt::Result {
+    match change {
+        Change::Added(value) => writeln!(f, "{:indent$}+ {name}: {value:?}", ""),
+        Change::Removed(value) => writeln!(f, "{:indent$}- {name}: {value:?}", ""),
+        Change::Modified { from, to } => writeln!(f, "{:indent$}~ {name}: {from:?} -> {to:?}", ""),
+    }
+}
+
+/// As [`write_change`], for values with an LP file representation such as [`ComparisonOp`]
+fn write_display_change<T: fmt::Display>(f: &mut fmt::Formatter<'_>, indent: usize, name: &str, change: &Change<T>) -> fmt::Result {
+    match change {
+        Change::Added(value) => writeln!(f, "{:indent$}+ {name}: {value}", ""),
+        Change::Removed(value) => writeln!(f, "{:indent$}- {name}: {value}", ""),
+        Change::Modified { from, to } => writeln!(f, "{:indent$}~ {name}: {from} -> {to}", ""),
+    }
+}
+
+fn write_coefficients(f: &mut fmt::Formatter<'_>, coefficients: &[CoefficientDiff<'_>]) -> fmt::Result {
+    coefficients.iter().try_for_each(|CoefficientDiff { var_name, change }| write_change(f, 4, var_name, change))
+}
+
+impl LPProblem {
+    #[must_use]
+    /// Computes the changes required to move from `self` to `other`
+    pub fn diff<'a>(&'a self, other: &'a Self) -> LPDiff<'a> {
+        self.diff_sections(other, true)
+    }
+
+    #[must_use]
+    /// Computes only the problem name, sense and variable changes between `self` and `other`
+    ///
+    /// The objective and constraint sections, which require comparing every coefficient, are left empty,
+    /// so the result is marked as a summary and never reports the problems as identical.
+    pub fn diff_summary<'a>(&'a self, other: &'a Self) -> LPDiff<'a> {
+        self.diff_sections(other, false)
+    }
+
+    fn diff_sections<'a>(&'a self, other: &'a Self, include_details: bool) -> LPDiff<'a> {
+        // Equality bails out on the first mismatch without allocating, so identical problems skip the detailed diff.
+        // It compares every coefficient though, so the summary goes straight to its cheaper sections instead
+        if include_details && self == other {
+            return LPDiff::default();
+        }
+        let mut diff = LPDiff {
+            problem_name: modified(self.problem_name.as_str(), other.problem_name.as_str()),
+            problem_sense: modified(&self.problem_sense, &other.problem_sense),
+            variables: diff_variables(&self.variables, &other.variables),
+            is_summary: !include_details,
+            ..LPDiff::default()
+        };
+        if include_details {
+            diff.objectives = diff_objectives(&self.objectives, &other.objectives);
+            diff.constraints = diff_constraints(&self.constraints, &other.constraints);
+        }
+        diff
+    }
+}
+
+fn modified<T: PartialEq>(from: T, to: T) -> Option<Change<T>> {
+    (from != to).then_some(Change::Modified { from, to })
+}
+
+fn diff_variables<'a>(left: &'a HashMap<String, VariableType>, right: &'a HashMap<String, VariableType>) -> Vec<VariableDiff<'a>> {
+    let mut removed = 0;
+    let mut diffs: Vec<VariableDiff<'a>> = left
+        .iter()
+        .filter_map(|(name, l)| {
+            let change = if let Some(r) = right.get(name) {
+                modified(l, r)?
+            } else {
+                removed += 1;
+                Change::Removed(l)
+            };
+            Some(VariableDiff { name, change })
+        })
+        .collect();
+    // When every right-hand name was matched above, the second round of lookups can be skipped
+    if left.len() - removed < right.len() {
+        diffs.extend(
+            right.iter().filter(|(name, _)| !left.contains_key(*name)).map(|(name, r)| VariableDiff { name, change: Change::Added(r) }),
+        );
+    }
+    // Only the changes are ordered, rather than the union of every name in both problems
+    diffs.sort_unstable_by(|a, b| a.name.cmp(b.name));
+    diffs
+}
+
+fn diff_coefficients<'a>(left: &'a [Coefficient], right: &'a [Coefficient]) -> Vec<CoefficientDiff<'a>> {
+    let (mut left, mut right): (Vec<&Coefficient>, Vec<&Coefficient>) = (left.iter().collect(), right.iter().collect());
+    // Repeated terms for a variable are ordered by value, so a reordered row still pairs them up
+    left.sort_unstable_by(|a, b| a.var_name.cmp(&b.var_name).then_with(|| a.coefficient.total_cmp(&b.coefficient)));
+    right.sort_unstable_by(|a, b| a.var_name.cmp(&b.var_name).then_with(|| a.coefficient.total_cmp(&b.coefficient)));
+    // Walking both sorted sides together yields the changes already in order, without hashing any names
+    let (mut left, mut right) = (left.into_iter().peekable(), right.into_iter().peekable());
+    let mut diffs = vec![];
+    loop {
+        let order = match (left.peek(), right.peek()) {
+            (Some(l), Some(r)) => l.var_name.cmp(&r.var_name),
+            (Some(_), None) => Ordering::Less,
+            (None, Some(_)) => Ordering::Greater,
+            (None, None) => break,
+        };
+        let diff = match order {
+            Ordering::Less => left.next().map(|l| CoefficientDiff { var_name: &l.var_name, change: Change::Removed(l.coefficient) }),
+            Ordering::Greater => right.next().map(|r| CoefficientDiff { var_name: &r.var_name, change: Change::Added(r.coefficient) }),
+            Ordering::Equal => left
+                .next()
+                .zip(right.next())
+                .and_then(|(l, r)| Some(CoefficientDiff { var_name: &l.var_name, change: modified(l.coefficient, r.coefficient)? })),
+        };
+        diffs.extend(diff);
+    }
+    diffs
+}
+
+fn diff_objectives<'a>(left: &'a [Objective], right: &'a [Objective]) -> Vec<ObjectiveDiff<'a>> {
+    // Objectives are few and usually listed in the same order, so an ordered comparison settles the common unchanged case
+    if left == right {
+        return vec![];
+    }
+    // Objectives are few and these indices only live for this call, so the faster unkeyed hasher is used
+    let left: FxHashMap<&str, &Objective> = left.iter().map(|o| (o.name.as_str(), o)).collect();
+    let right: FxHashMap<&str, &Objective> = right.iter().map(|o| (o.name.as_str(), o)).collect();
+    let mut diffs: Vec<ObjectiveDiff<'a>> = left
+        .iter()
+        .filter_map(|(name, l)| match right.get(name) {
+            Some(r) if l == r => None,
+            Some(r) => {
+                let coefficients = diff_coefficients(&l.coefficients, &r.coefficients);
+                (!coefficients.is_empty()).then_some(ObjectiveDiff::Modified { name, coefficients })
+            }
+            None => Some(ObjectiveDiff::Removed(l)),
+        })
+        .chain(right.iter().filter(|(name, _)| !left.contains_key(*name)).map(|(_, r)| ObjectiveDiff::Added(r)))
+        .collect();
+    diffs.sort_unstable_by(|a, b| a.name().cmp(b.name()));
+    diffs
+}
+
+#[allow(clippy::wildcard_enum_match_arm)]
+fn diff_constraint<'a>(name: &'a str, left: &'a Constraint, right: &'a Constraint) -> Vec<ConstraintDiff<'a>> {
+    // Unchanged constraints skip sorting and merging their coefficients
+    if left == right {
+        return vec![];
+    }
+    match (left, right) {
+        (
+            Constraint::Standard { coefficients: l_coefficients, sense: l_sense, rhs: l_rhs, .. },
+            Constraint::Standard { coefficients: r_coefficients, sense: r_sense, rhs: r_rhs, .. },
+        ) => {
+            let (sense, rhs, coefficients) =
+                (modified(*l_sense, *r_sense), modified(*l_rhs, *r_rhs), diff_coefficients(l_coefficients, r_coefficients));
+            if sense.is_none() && rhs.is_none() && coefficients.is_empty() {
+                return vec![];
+            }
+            vec![ConstraintDiff::Modified { name, sense, rhs, coefficients }]
+        }
+        (
+            Constraint::SOS { kind: l_kind, coefficients: l_coefficients, .. },
+            Constraint::SOS { kind: r_kind, coefficients: r_coefficients, .. },
+        ) if l_kind == r_kind => {
+            let coefficients = diff_coefficients(l_coefficients, r_coefficients);
+            if coefficients.is_empty() {
+                return vec![];
+            }
+            vec![ConstraintDiff::Modified { name, sense: None, rhs: None, coefficients }]
+        }
+        // The constraint kind has changed, so it has been replaced outright
+        _ => vec![ConstraintDiff::Removed(left), ConstraintDiff::Added(right)],
+    }
+}
+
+fn diff_constraints<'a>(left: &'a HashMap<String, Constraint>, right: &'a HashMap<String, Constraint>) -> Vec<ConstraintDiff<'a>> {
+    let mut diffs: Vec<ConstraintDiff<'a>> = left
+        .iter()
+        .flat_map(|(name, l)| match right.get(name) {
+            Some(r) => diff_constraint(name, l, r),
+            None => vec![ConstraintDiff::Removed(l)],
+        })
+        .chain(right.iter().filter(|(name, _)| !left.contains_key(*name)).map(|(_, r)| ConstraintDiff::Added(r)))
+        .collect();
+    // A stable sort keeps a replaced constraint's removal ahead of its addition
+    diffs.sort_by(|a, b| a.name().cmp(b.name()));
+    diffs
+}
@@ -17,12 +17,15 @@
 //! - Semi-continuous
 //! - Special Order Sets (SOS)
 //!
+//! Two parsed problems can be compared with [`model::lp_problem::LPProblem::diff`].
+//!
 
 #![allow(clippy::module_name_repetitions)]
 
 use pest_derive::Parser;
 
 pub mod common;
+pub mod compare;
 pub mod model;
 pub mod lp_parts;
 pub mod parse;
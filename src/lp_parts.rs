@@ -1,57 +1,65 @@
-use std::str::FromStr;
-
 use pest::iterators::Pair;
-use unique_id::{sequence::SequenceGenerator, Generator};
 
 use crate::{
     common::RuleExt,
-    model::{constraint::Constraint, lp_problem::LPProblem, objective::Objective, sense::Sense, sos::SOSClass, variable::VariableType},
+    model::{
+        coefficient::Coefficient, constraint::Constraint, lp_problem::LPProblem, objective::Objective, sense::Sense, variable::VariableType,
+    },
     Rule,
 };
 
+/// The id given to the first unnamed objective or constraint in a file, e.g. `obj_2024`
+pub const FIRST_GENERATED_ID: u64 = 2024;
+
+/// Hands out the next id for an unnamed objective or constraint
+fn next_id(ids: &mut u64) -> u64 {
+    let id = *ids;
+    *ids += 1;
+    id
+}
+
 #[allow(clippy::unwrap_used)]
-fn compose_objective(pair: Pair<'_, Rule>, gen: &mut SequenceGenerator) -> anyhow::Result<Objective> {
+fn compose_objective(pair: Pair<'_, Rule>, ids: &mut u64) -> anyhow::Result<Objective> {
     let mut parts = pair.into_inner().peekable();
     // Objective name can be omitted in LP files, so we need to handle that case
     let name = if parts.peek().unwrap().as_rule() == Rule::OBJECTIVE_NAME {
         parts.next().unwrap().as_str().to_string()
     } else {
-        format!("obj_{}", gen.next_id())
+        format!("obj_{}", next_id(ids))
     };
     let coefficients: anyhow::Result<Vec<_>> = parts.map(|p| p.into_inner().try_into()).collect();
     Ok(Objective { name, coefficients: coefficients? })
 }
 
 #[allow(clippy::unwrap_used)]
-fn compose_constraint(pair: Pair<'_, Rule>, gen: &mut SequenceGenerator) -> anyhow::Result<Constraint> {
+fn compose_constraint(pair: Pair<'_, Rule>, ids: &mut u64) -> anyhow::Result<Constraint> {
     let mut parts = pair.into_inner().peekable();
     // Constraint name can be omitted in LP files, so we need to handle that case
     let name = if parts.peek().unwrap().as_rule() == Rule::CONSTRAINT_NAME {
         parts.next().unwrap().as_str().to_string()
     } else {
-        format!("con_{}", gen.next_id())
+        format!("con_{}", next_id(ids))
     };
-    let mut coefficients: Vec<_> = vec![];
-    while let Some(p) = parts.peek() {
-        if p.as_rule().is_cmp() {
-            break;
+    // Terms are converted as they are read, up to the comparison operator, rather than being buffered first
+    let mut coefficients: Vec<Coefficient> = vec![];
+    while let Some(p) = parts.next_if(|p| !p.as_rule().is_cmp()) {
+        if !matches!(p.as_rule(), Rule::PLUS | Rule::MINUS) {
+            coefficients.push(p.into_inner().try_into()?);
         }
-        coefficients.push(parts.next().unwrap());
     }
-    let coefficients: anyhow::Result<Vec<_>> =
-        coefficients.into_iter().filter(|p| !matches!(p.as_rule(), Rule::PLUS | Rule::MINUS)).map(|p| p.into_inner().try_into()).collect();
-    let sense = parts.next().unwrap().as_str().to_string();
+    let sense = parts.next().unwrap().as_rule().into();
     let rhs = parts.next().unwrap().as_str().parse()?;
-    Ok(Constraint::Standard { name, coefficients: coefficients?, sense, rhs })
+    Ok(Constraint::Standard { name, coefficients, sense, rhs })
 }
 
 #[allow(clippy::unwrap_used)]
 fn compose_sos(pair: Pair<'_, Rule>) -> anyhow::Result<Constraint> {
     let mut parts = pair.into_inner();
     let name = parts.next().unwrap().as_str().to_string();
-    let kind = parts.next().unwrap().as_str().to_lowercase();
+    // The grammar has already classified the set type, so no case-folded string matching is needed
+    let kind = parts.next().unwrap().as_rule().into();
     let coefficients: anyhow::Result<Vec<_>> = parts.map(|p| p.into_inner().try_into()).collect();
-    Ok(Constraint::SOS { name, kind: SOSClass::from_str(&kind)?, coefficients: coefficients? })
+    Ok(Constraint::SOS { name, kind, coefficients: coefficients? })
 }
 
 #[allow(clippy::wildcard_enum_match_arm, clippy::unwrap_used)]
@@ -96,7 +104,7 @@ fn get_bound(pair: Pair<'_, Rule>) -> Option<(&str, VariableType)> {
 #[allow(clippy::wildcard_enum_match_arm)]
 /// # Errors
 /// Returns an error if the `compose` fails
-pub fn compose(pair: Pair<'_, Rule>, mut parsed: LPProblem, gen: &mut SequenceGenerator) -> anyhow::Result<LPProblem> {
+pub fn compose(pair: Pair<'_, Rule>, mut parsed: LPProblem, ids: &mut u64) -> anyhow::Result<LPProblem> {
     match pair.as_rule() {
         // Problem Name
         Rule::PROBLEM_NAME => return Ok(parsed.with_problem_name(pair.as_str())),
@@ -106,18 +114,20 @@ pub fn compose(pair: Pair<'_, Rule>, mut parsed: LPProblem, gen: &mut SequenceGe
         // Problem Objectives
         Rule::OBJECTIVES => {
             let objectives: anyhow::Result<Vec<Objective>> =
-                pair.into_inner().map(|inner_pair| compose_objective(inner_pair, gen)).collect();
+                pair.into_inner().map(|inner_pair| compose_objective(inner_pair, ids)).collect();
             parsed.add_objective(objectives?);
         }
         // Problem Constraints
+        // Each constraint is added as soon as it is composed, without collecting the section first
         Rule::CONSTRAINTS => {
-            let constraints: anyhow::Result<Vec<Constraint>> =
-                pair.into_inner().map(|inner_pair| compose_constraint(inner_pair, gen)).collect();
-            parsed.add_constraints(constraints?);
+            for inner_pair in pair.into_inner() {
+                parsed.add_constraint(compose_constraint(inner_pair, ids)?);
+            }
         }
         Rule::SOS => {
-            let constraints: anyhow::Result<Vec<Constraint>> = pair.into_inner().map(|inner_pair| compose_sos(inner_pair)).collect();
-            parsed.add_constraints(constraints?);
+            for inner_pair in pair.into_inner() {
+                parsed.add_constraint(compose_sos(inner_pair)?);
+            }
         }
         // Problem Bounds
         Rule::BOUNDS => {
@@ -1,10 +1,10 @@
-use crate::model::{coefficient::Coefficient, sos::SOSClass};
+use crate::model::{coefficient::Coefficient, operator::ComparisonOp, sos::SOSClass};
 
 #[derive(Debug, Clone)]
 #[cfg_attr(feature = "serde", derive(serde::Serialize, serde::Deserialize))]
 pub enum Constraint {
     /// Standard LP constraint
-    Standard { name: String, coefficients: Vec<Coefficient>, sense: String, rhs: f64 },
+    Standard { name: String, coefficients: Vec<Coefficient>, sense: ComparisonOp, rhs: f64 },
     /// Special Order Set (SOS)
     SOS { name: String, kind: SOSClass, coefficients: Vec<Coefficient> },
 }
@@ -29,9 +29,9 @@ impl Eq for Constraint {}
 
 impl Constraint {
     #[must_use]
-    pub fn name(&self) -> String {
+    pub fn name(&self) -> &str {
         match self {
-            Self::Standard { name, .. } | Self::SOS { name, .. } => name.to_string(),
+            Self::Standard { name, .. } | Self::SOS { name, .. } => name,
         }
     }
 
@@ -1,4 +1,4 @@
-use std::collections::{hash_map::Entry, HashMap};
+use std::collections::HashMap;
 
 use crate::model::{constraint::Constraint, objective::Objective, sense::Sense, variable::VariableType};
 
@@ -23,21 +23,55 @@ impl LPProblem {
         Self { problem_sense, ..self }
     }
 
+    #[must_use]
+    pub fn variable_count(&self) -> usize {
+        self.variables.len()
+    }
+
+    #[must_use]
+    pub fn objective_count(&self) -> usize {
+        self.objectives.len()
+    }
+
+    #[must_use]
+    pub fn constraint_count(&self) -> usize {
+        self.constraints.len()
+    }
+
+    #[must_use]
+    pub fn variable(&self, name: &str) -> Option<&VariableType> {
+        self.variables.get(name)
+    }
+
+    #[must_use]
+    /// Looks up an objective by name, scanning the objectives in file order
+    ///
+    /// Problems rarely have more than a handful of objectives, so they are kept in a `Vec` rather than indexed by name.
+    pub fn objective(&self, name: &str) -> Option<&Objective> {
+        self.objectives.iter().find(|o| o.name == name)
+    }
+
+    #[must_use]
+    /// Looks up a constraint by name without scanning the collection
+    pub fn constraint(&self, name: &str) -> Option<&Constraint> {
+        self.constraints.get(name)
+    }
+
+    // Variables recur in every objective and constraint they appear in, so the name is only
+    // copied into an owned key the first time it is seen
     pub fn add_variable(&mut self, name: &str) {
-        if !name.is_empty() {
-            self.variables.entry(name.to_string()).or_default();
+        if !name.is_empty() && !self.variables.contains_key(name) {
+            self.variables.insert(name.to_string(), VariableType::default());
         }
     }
 
     pub fn set_var_bounds(&mut self, name: &str, kind: VariableType) {
         if !name.is_empty() {
-            match self.variables.entry(name.to_string()) {
-                Entry::Occupied(k) if matches!(kind, VariableType::SemiContinuous) => {
-                    k.into_mut().set_semi_continuous();
-                }
-                Entry::Occupied(k) => *k.into_mut() = kind,
-                Entry::Vacant(k) => {
-                    k.insert(kind);
+            match self.variables.get_mut(name) {
+                Some(v) if matches!(kind, VariableType::SemiContinuous) => v.set_semi_continuous(),
+                Some(v) => *v = kind,
+                None => {
+                    self.variables.insert(name.to_string(), kind);
                 }
             }
         }
@@ -52,13 +86,17 @@ impl LPProblem {
         self.objectives = objectives;
     }
 
+    pub fn add_constraint(&mut self, con: Constraint) {
+        let name = if con.name().is_empty() { format!("UnnamedConstraint:{}", self.constraints.len()) } else { con.name().to_string() };
+        con.coefficients().iter().for_each(|c| {
+            self.add_variable(&c.var_name);
+        });
+        self.constraints.entry(name).or_insert(con);
+    }
+
     pub fn add_constraints(&mut self, constraints: Vec<Constraint>) {
         for con in constraints {
-            let name = if con.name().is_empty() { format!("UnnamedConstraint:{}", self.constraints.len()) } else { con.name() };
-            con.coefficients().iter().for_each(|c| {
-                self.add_variable(&c.var_name);
-            });
-            self.constraints.entry(name).or_insert(con);
+            self.add_constraint(con);
         }
     }
 }
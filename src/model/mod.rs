@@ -2,6 +2,7 @@ pub mod coefficient;
 pub mod constraint;
 pub mod lp_problem;
 pub mod objective;
+pub mod operator;
 pub mod sense;
 pub mod sos;
 pub mod variable;
@@ -0,0 +1,46 @@
+use std::fmt;
+
+use crate::Rule;
+
+#[derive(Debug, PartialEq, Eq, Clone, Copy)]
+#[cfg_attr(feature = "serde", derive(serde::Serialize, serde::Deserialize))]
+/// The comparison operator of a constraint, serialized as its LP file symbol
+pub enum ComparisonOp {
+    #[cfg_attr(feature = "serde", serde(rename = ">"))]
+    GreaterThan,
+    #[cfg_attr(feature = "serde", serde(rename = ">="))]
+    GreaterOrEqual,
+    #[cfg_attr(feature = "serde", serde(rename = "="))]
+    Equal,
+    #[cfg_attr(feature = "serde", serde(rename = "<"))]
+    LessThan,
+    #[cfg_attr(feature = "serde", serde(rename = "<="))]
+    LessOrEqual,
+}
+
+impl From<Rule> for ComparisonOp {
+    #[allow(clippy::wildcard_enum_match_arm, clippy::unreachable)]
+    fn from(value: Rule) -> Self {
+        match value {
+            Rule::GT => Self::GreaterThan,
+            Rule::GTE => Self::GreaterOrEqual,
+            Rule::EQ => Self::Equal,
+            Rule::LT => Self::LessThan,
+            Rule::LTE => Self::LessOrEqual,
+            _ => unreachable!(),
+        }
+    }
+}
+
+/// Writes the operator as it appears in an LP file
+impl fmt::Display for ComparisonOp {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.write_str(match self {
+            Self::GreaterThan => ">",
+            Self::GreaterOrEqual => ">=",
+            Self::Equal => "=",
+            Self::LessThan => "<",
+            Self::LessOrEqual => "<=",
+        })
+    }
+}
@@ -1,5 +1,7 @@
 use std::str::FromStr;
 
+use crate::Rule;
+
 #[derive(Debug, PartialEq, Eq, Clone)]
 #[cfg_attr(feature = "serde", derive(serde::Serialize, serde::Deserialize))]
 pub enum SOSClass {
@@ -18,3 +20,14 @@ impl FromStr for SOSClass {
         }
     }
 }
+
+impl From<Rule> for SOSClass {
+    #[allow(clippy::wildcard_enum_match_arm, clippy::unreachable)]
+    fn from(value: Rule) -> Self {
+        match value {
+            Rule::TYPE1 => Self::S1,
+            Rule::TYPE2 => Self::S2,
+            _ => unreachable!(),
+        }
+    }
+}
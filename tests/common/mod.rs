@@ -0,0 +1,19 @@
+use std::{path::PathBuf, sync::OnceLock};
+
+use lp_parser_rs::{
+    model::lp_problem::LPProblem,
+    parse::{parse_file, parse_lp_file},
+};
+
+/// Parsed once and shared by the tests that only read afiro
+pub fn afiro() -> &'static LPProblem {
+    static AFIRO: OnceLock<LPProblem> = OnceLock::new();
+    AFIRO.get_or_init(|| read_file_from_resources("afiro.lp").unwrap())
+}
+
+pub fn read_file_from_resources(file_name: &str) -> anyhow::Result<LPProblem> {
+    let mut file_path = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    file_path.push(format!("resources/{file_name}"));
+    let contents = parse_file(&file_path)?;
+    parse_lp_file(&contents)
+}
@@ -0,0 +1,109 @@
+use std::path::PathBuf;
+
+use lp_parser_rs::{
+    compare::{Change, CoefficientDiff, ConstraintDiff, ObjectiveDiff, VariableDiff},
+    model::{constraint::Constraint, lp_problem::LPProblem, operator::ComparisonOp, sos::SOSClass},
+    parse::parse_lp_file_pair,
+};
+
+use crate::common::afiro;
+
+mod common;
+
+#[test]
+fn identical() {
+    let problem = afiro();
+    assert!(problem.diff(problem).is_empty());
+}
+
+#[test]
+fn afiro_ext() {
+    let resources = PathBuf::from(env!("CARGO_MANIFEST_DIR")).join("resources");
+    let (left, right) = parse_lp_file_pair(&resources.join("afiro.lp"), &resources.join("afiro_ext.lp")).unwrap();
+    assert_eq!(left, *afiro());
+    let diff = left.diff(&right);
+    assert!(!diff.is_empty());
+    assert_eq!(diff.problem_name, Some(Change::Modified { from: "afiro.mps", to: "afiro_ext.mps" }));
+    assert_eq!(diff.problem_sense, None);
+    assert_eq!(diff.variables.iter().filter(|v| matches!(v.change, Change::Added(_))).count(), 15);
+    assert_eq!(diff.variables.iter().filter(|v| matches!(v.change, Change::Modified { .. })).count(), 7);
+    assert!(matches!(diff.objectives.as_slice(), [ObjectiveDiff::Added(o)] if o.name == "OBJECTIV"));
+    assert!(matches!(
+        diff.constraints.as_slice(),
+        [ConstraintDiff::Modified { name, sense: None, rhs: Some(Change::Modified { .. }), coefficients }] if *name == "X51:" && coefficients.is_empty()
+    ));
+
+    let report = diff.to_string();
+    assert!(report.contains("Objectives:\n  + OBJECTIV\n"));
+    assert!(report.contains("  ~ X51:\n    ~ rhs: 300.0 -> 1300.0\n"));
+
+    let summary = left.diff_summary(&right);
+    assert_eq!((summary.problem_name, summary.variables), (diff.problem_name, diff.variables));
+    assert!(summary.objectives.is_empty() && summary.constraints.is_empty());
+
+    // The reverse comparison mirrors every change
+    let reverse = right.diff(&left);
+    assert_eq!(reverse.variables.iter().filter(|v| matches!(v.change, Change::Removed(_))).count(), 15);
+    assert!(matches!(reverse.objectives.as_slice(), [ObjectiveDiff::Removed(o)] if o.name == "OBJECTIV"));
+}
+
+#[test]
+fn coefficient_changes() {
+    let left: LPProblem = "Minimize\nobj: x + y\nSubject To\nc1: x + 2 y + z <= 4\nEnd\n".parse().unwrap();
+    let right: LPProblem = "Minimize\nobj: x + 3 y\nSubject To\nc1: 3 y + z + w = 4\nEnd\n".parse().unwrap();
+    let diff = left.diff(&right);
+    assert!(matches!(diff.variables.as_slice(), [VariableDiff { name: "w", change: Change::Added(_) }]));
+    let [ObjectiveDiff::Modified { name: "obj", coefficients }] = diff.objectives.as_slice() else {
+        panic!("Expected a modified objective, got {:?}", diff.objectives);
+    };
+    assert_eq!(*coefficients, vec![CoefficientDiff { var_name: "y", change: Change::Modified { from: 1.0, to: 3.0 } }]);
+    let [ConstraintDiff::Modified { name: "c1:", sense, rhs: None, coefficients }] = diff.constraints.as_slice() else {
+        panic!("Expected a modified constraint, got {:?}", diff.constraints);
+    };
+    assert_eq!(*sense, Some(Change::Modified { from: ComparisonOp::LessOrEqual, to: ComparisonOp::Equal }));
+    assert_eq!(
+        *coefficients,
+        vec![
+            CoefficientDiff { var_name: "w", change: Change::Added(1.0) },
+            CoefficientDiff { var_name: "x", change: Change::Removed(1.0) },
+            CoefficientDiff { var_name: "y", change: Change::Modified { from: 2.0, to: 3.0 } },
+        ]
+    );
+    // Operators are reported with their LP file symbols, as in the serialized diff
+    assert!(diff.to_string().contains("  ~ c1:\n    ~ sense: <= -> =\n    + w: 1.0\n    - x: 1.0\n    ~ y: 2.0 -> 3.0\n"));
+}
+
+#[test]
+fn summary_with_constraint_change() {
+    let left: LPProblem = "Minimize\nobj: x + y\nSubject To\nc1: x + y <= 4\nEnd\n".parse().unwrap();
+    let right: LPProblem = "Minimize\nobj: x + y\nSubject To\nc1: x + y <= 5\nEnd\n".parse().unwrap();
+    assert!(!left.diff(&right).is_empty());
+    // Only the constraint changed, which a summary does not inspect, so it must not report the problems as identical
+    let summary = left.diff_summary(&right);
+    assert!(summary.is_summary && summary.variables.is_empty() && summary.constraints.is_empty());
+    assert!(!summary.is_empty());
+    assert!(!left.diff_summary(&left).is_empty());
+}
+
+#[test]
+fn reordered_repeated_terms() {
+    let left: LPProblem = "Minimize\nobj: x + 2 x + y\nSubject To\nc1: x + 2 x <= 4\nEnd\n".parse().unwrap();
+    let right: LPProblem = "Minimize\nobj: 2 x + x + y\nSubject To\nc1: 2 x + x <= 4\nEnd\n".parse().unwrap();
+    // The rows are ordered differently, but pair up to the same terms
+    assert_ne!(left, right);
+    assert!(left.diff(&right).is_empty());
+}
+
+#[test]
+fn sos_kind_change() {
+    let left: LPProblem = "Minimize\nobj: x + y\nSubject To\nc1: x + y <= 1\nSOS\ns1: S1:: x:1 y:2\nEnd\n".parse().unwrap();
+    let right: LPProblem = "Minimize\nobj: x + y\nSubject To\nc1: x + y <= 1\nSOS\ns1: S2:: x:1 y:2\nEnd\n".parse().unwrap();
+    let diff = left.diff(&right);
+    assert!(matches!(
+        diff.constraints.as_slice(),
+        [
+            ConstraintDiff::Removed(Constraint::SOS { kind: SOSClass::S1, .. }),
+            ConstraintDiff::Added(Constraint::SOS { kind: SOSClass::S2, .. }),
+        ]
+    ));
+}
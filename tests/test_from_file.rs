@@ -1,10 +1,14 @@
 use std::path::PathBuf;
 
 use lp_parser_rs::{
-    model::lp_problem::LPProblem,
-    parse::{parse_file, parse_lp_file},
+    model::{constraint::Constraint, lp_problem::LPProblem, variable::VariableType},
+    parse::parse_lp_files,
 };
 
+use crate::common::{afiro, read_file_from_resources};
+
+mod common;
+
 #[macro_export]
 macro_rules! generate_test {
     ($test_name:ident, $file:expr, $o_sum:expr, $c_sum:expr) => {
@@ -42,7 +46,6 @@ generate_test!(obj_1cons_all_variables_with_bounds, "1obj_1cons_all_variables_wi
 generate_test!(semi_continuous, "semi_continuous.lp", 2., 0.);
 generate_test!(sos, "sos.lp", 0., 17.5);
 generate_test!(test, "test.lp", 2., 2.9899);
-generate_test!(test2, "test2.lp", -6., 147.);
 generate_test!(empty_bounds, "empty_bounds.lp", 11., 2.);
 generate_test!(blank_lines, "blank_lines.lp", 11., 2.);
 generate_test!(optional_labels, "optional_labels.lp", 11., 1.);
@@ -51,15 +54,49 @@ generate_test!(infile_comments2, "infile_comments2.lp", 43., 0.);
 generate_test!(missing_signs, "missing_signs.lp", 43., -3.);
 generate_test!(fit2d, "fit2d.lp", 349048.9, -296677.389);
 
+#[test]
+fn counts() {
+    let result = afiro();
+    assert_eq!((result.variable_count(), result.objective_count(), result.constraint_count()), (32, 3, 27));
+    let empty = LPProblem::default();
+    assert_eq!((empty.variable_count(), empty.objective_count(), empty.constraint_count()), (0, 0, 0));
+}
+
+#[test]
+fn lookup_by_name() {
+    let result = afiro();
+    assert_eq!(result.objective("OBJ2").map(|o| o.coefficients.len()), Some(3));
+    assert!(result.objective("missing").is_none());
+    assert!(matches!(result.constraint("X51:"), Some(Constraint::Standard { rhs, .. }) if *rhs == 300.0));
+    assert!(result.constraint("missing").is_none());
+    assert_eq!(result.variable("X01"), Some(&VariableType::General));
+    assert!(result.variable("missing").is_none());
+}
+
+#[test]
+fn from_str() {
+    let result: LPProblem =
+        "\\ LP format example\n\nMinimize\nx + 10 y\nSubject To\n-x + 2y  >= 1\n\nBinaries\n x y z a\nEnd\n".parse().unwrap();
+    // Unnamed rows are numbered per parse, so the generated names do not depend on tests running alongside
+    assert!(result.objective("obj_2024").is_some() && result.constraint("con_2025").is_some());
+    assert_eq!(result, read_file_from_resources("optional_labels.lp").unwrap());
+}
+
+#[test]
+fn batch() {
+    // limbo, optional_labels and 3obj_2cons have unnamed rows, whose generated names must not depend on the other parses
+    let names = ["afiro.lp", "boeing1.lp", "sos.lp", "pulp.lp", "kb2.lp", "limbo.lp", "optional_labels.lp", "3obj_2cons.lp"];
+    let resources = PathBuf::from(env!("CARGO_MANIFEST_DIR")).join("resources");
+    let problems = parse_lp_files(&names.map(|name| resources.join(name))).unwrap();
+    assert_eq!(problems.len(), names.len());
+    for (problem, name) in problems.iter().zip(names) {
+        assert_eq!(*problem, read_file_from_resources(name).unwrap());
+    }
+    assert!(parse_lp_files(&[resources.join("afiro.lp"), resources.join("invalid.lp")]).is_err());
+}
+
 #[test]
 fn invalid() {
     let result = read_file_from_resources("invalid.lp");
     assert!(result.is_err());
 }
-
-fn read_file_from_resources(file_name: &str) -> anyhow::Result<LPProblem> {
-    let mut file_path = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
-    file_path.push(format!("resources/{file_name}"));
-    let contents = parse_file(&file_path)?;
-    parse_lp_file(&contents)
-}